@@ -15,12 +15,14 @@ __author__ = "Sunrise"
 __email__ = "sunr1s2@proton.me"
 
 from .PASS_NICE import PASS_NICE
+from .admission import AdmissionController
 from .types import Result
 
 from .exceptions import *  # noqa: F401,F403
 
 __all__ = [
     "PASS_NICE",
+    "AdmissionController",
     "Result",
     "__version__"
 ]
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+PASS-NICE 커맨드라인 진입점
+
+사용 예시:
+    python -m pass_nice bench --flows 500 --concurrency 100
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from . import __version__, bench
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="pass_nice", description="PASS-NICE 커맨드라인 도구")
+    parser.add_argument("--version", action="version", version=f"pass_nice {__version__}")
+
+    subparsers = parser.add_subparsers(dest="command")
+    bench.add_arguments(
+        subparsers.add_parser("bench", help="로컬 가짜 서버를 대상으로 부하 테스트 및 프로파일링을 실행합니다.")
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "bench":
+        return bench.run(args)
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+PASS-NICE 어드미션 컨트롤러
+
+동시에 시작되는 인증 플로우 수를 제한하고, NICE 서버의 응답 지연에 따라
+허용 동시성을 AIMD(Additive Increase / Multiplicative Decrease) 방식으로 조절합니다.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
+
+from .exceptions import AdmissionRejectedError, ValidationError
+
+
+class AdmissionController:
+    """
+    새로운 인증 플로우(`init_session`)의 진입을 제어하는 어드미션 컨트롤러입니다.
+
+    - 기능
+        - 동시에 진행 중인 세션 수를 `limit` 이하로 제한합니다.
+        - 한도를 초과한 새로운 플로우는 최대 `max_queue`개까지 대기열에서 최대 `queue_timeout`초 동안 대기합니다.
+        - NICE 서버 요청 1건의 응답 시간이 `latency_target`을 넘으면 한도를 `backoff_ratio`배로 줄이고, 그렇지 않으면 한도를 조금씩 늘립니다.
+        - 진입한 세션은 리스(lease)를 받으며, `lease_timeout`초 동안 요청이 없으면 리스가 만료되어 슬롯이 반환됩니다.
+
+    - Notes
+        - 대기열이 가득 찼거나 대기 시간이 초과되면 `AdmissionRejectedError`가 발생합니다.
+        - 인증을 이미 전송한 세션(`promote()`)이 한도를 모두 차지하고 있다면, 새로운 플로우는 대기 없이 즉시 거절됩니다.
+        - 인증을 전송한 세션은 한도가 줄어들어도 슬롯을 잃지 않고 계속 진행됩니다.
+        - 여러 `PASS_NICE` 객체가 하나의 컨트롤러를 공유하도록 사용해야 합니다.
+    """
+
+    def __init__(
+        self, max_sessions: int = 100, min_sessions: int = 1,
+        initial_sessions: Optional[int] = None, max_queue: int = 100,
+        queue_timeout: float = 5.0, latency_target: float = 3.0,
+        backoff_ratio: float = 0.5, backoff_interval: float = 1.0,
+        lease_timeout: float = 300.0
+    ):
+        """
+        Args:
+            max_sessions: 동시에 진행 가능한 최대 세션 수
+            min_sessions: 부하 상황에서도 보장되는 최소 세션 수
+            initial_sessions: 시작 시 허용 세션 수 (기본값: max_sessions)
+            max_queue: 대기열의 최대 길이
+            queue_timeout: 대기열에서 기다리는 최대 시간 (초)
+            latency_target: 부하로 판단하는 요청 1건의 응답 시간 기준 (초)
+            backoff_ratio: 부하 감지 시 허용 세션 수에 곱해지는 비율 (0 ~ 1)
+            backoff_interval: 허용 세션 수를 다시 줄이기까지의 최소 간격 (초)
+            lease_timeout: 세션이 요청 없이 슬롯을 유지할 수 있는 최대 시간 (초)
+        """
+
+        if not 1 <= min_sessions <= max_sessions:
+            raise ValidationError("min_sessions는 1 이상, max_sessions 이하여야 합니다.")
+
+        if initial_sessions is None:
+            initial_sessions = max_sessions
+
+        if not min_sessions <= initial_sessions <= max_sessions:
+            raise ValidationError("initial_sessions는 min_sessions 이상, max_sessions 이하여야 합니다.")
+
+        if max_queue < 0:
+            raise ValidationError("max_queue는 0 이상이어야 합니다.")
+
+        if queue_timeout < 0:
+            raise ValidationError("queue_timeout은 0 이상이어야 합니다.")
+
+        if not 0 < backoff_ratio < 1:
+            raise ValidationError("backoff_ratio는 0과 1 사이의 값이어야 합니다.")
+
+        if lease_timeout <= 0:
+            raise ValidationError("lease_timeout은 0보다 커야 합니다.")
+
+        self._max_sessions = max_sessions
+        self._min_sessions = min_sessions
+        self._max_queue = max_queue
+        self._queue_timeout = queue_timeout
+        self._latency_target = latency_target
+        self._backoff_ratio = backoff_ratio
+        self._backoff_interval = backoff_interval
+        self._lease_timeout = lease_timeout
+
+        self._limit = float(initial_sessions)
+        self._last_backoff = float("-inf")
+
+        # 리스 ID -> 만료 시각, 인증을 전송한(promote) 리스 ID 목록
+        self._leases: Dict[int, float] = {}
+        self._promoted: Set[int] = set()
+        self._lease_ids = itertools.count(1)
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """현재 허용되는 동시 세션 수를 반환"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """현재 진행 중인 세션 수를 반환"""
+        self._expire_leases()
+        return len(self._leases)
+
+    @property
+    def in_progress(self) -> int:
+        """진행 중인 세션 중 인증을 이미 전송한 세션 수를 반환"""
+        self._expire_leases()
+        return len(self._promoted)
+
+    @property
+    def queued(self) -> int:
+        """대기열에서 기다리는 플로우 수를 반환"""
+        return len(self._waiters)
+
+    async def acquire(self) -> int:
+        """
+        새로운 인증 플로우를 위한 슬롯을 확보합니다.
+
+        Returns:
+            int: 확보한 슬롯의 리스 ID (renew, promote, release에 사용)
+
+        Raises:
+            AdmissionRejectedError: 대기열이 가득 찼거나, 대기 시간 내에 슬롯을 확보하지 못한 경우 발생하는 예외입니다.
+        """
+        self._expire_leases()
+
+        if not self._waiters and len(self._leases) < self.limit:
+            return self._grant()
+
+        # 인증을 전송한 세션만으로 한도가 찼다면 곧 비워질 가능성이 낮으므로 즉시 거절
+        if len(self._promoted) >= self.limit:
+            raise AdmissionRejectedError("인증을 진행 중인 세션이 많아 새로운 인증 세션을 시작할 수 없습니다.")
+
+        if len(self._waiters) >= self._max_queue:
+            raise AdmissionRejectedError("대기열이 가득 차 새로운 인증 세션을 시작할 수 없습니다.")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        deadline = time.monotonic() + self._queue_timeout
+
+        try:
+            while True:
+                # 대기 중에 만료되는 리스가 있다면 그 시점에 깨어나 슬롯을 회수
+                now = time.monotonic()
+                timeout = deadline - now
+                if self._leases:
+                    timeout = min(timeout, min(self._leases.values()) - now)
+
+                try:
+                    return await asyncio.wait_for(asyncio.shield(waiter), max(timeout, 0))
+
+                except asyncio.TimeoutError:
+                    self._expire_leases()
+                    if waiter.done():
+                        return waiter.result()
+
+                    if time.monotonic() >= deadline:
+                        self._discard(waiter)
+                        raise AdmissionRejectedError("대기 시간이 초과되어 새로운 인증 세션을 시작할 수 없습니다.")
+
+        except asyncio.CancelledError:
+            self._discard(waiter)
+            raise
+
+    def renew(self, lease: int) -> None:
+        """세션의 리스 만료 시각을 연장합니다. (이미 만료된 리스는 무시됩니다.)"""
+        if lease in self._leases:
+            self._leases[lease] = time.monotonic() + self._lease_timeout
+
+    def promote(self, lease: int) -> None:
+        """세션이 SMS/PASS 인증을 전송했음을 기록합니다."""
+        if lease in self._leases:
+            self._promoted.add(lease)
+            self.renew(lease)
+
+    def release(self, lease: int) -> None:
+        """확보한 슬롯을 반환합니다. (이미 반환되었거나 만료된 리스는 무시됩니다.)"""
+        if self._leases.pop(lease, None) is None:
+            return
+
+        self._promoted.discard(lease)
+        self._wake()
+
+    def observe(self, latency: float) -> None:
+        """
+        NICE 서버 요청 1건의 응답 시간을 기록하고 허용 세션 수를 조절합니다.
+
+        Args:
+            latency: 요청 1건의 응답 시간 (초)
+        """
+        if latency > self._latency_target:
+            # 한 번의 지연 구간에서 한도가 연속으로 줄어드는 것을 방지
+            now = time.monotonic()
+            if now - self._last_backoff >= self._backoff_interval:
+                self._limit = max(self._min_sessions, self._limit * self._backoff_ratio)
+                self._last_backoff = now
+
+            return
+
+        self._limit = min(self._max_sessions, self._limit + 1 / self._limit)
+        self._wake()
+
+    # ----- helper ----- #
+    def _grant(self) -> int:
+        lease = next(self._lease_ids)
+        self._leases[lease] = time.monotonic() + self._lease_timeout
+        return lease
+
+    def _expire_leases(self) -> None:
+        """만료된 리스(요청 없이 방치된 세션)의 슬롯을 회수합니다."""
+        now = time.monotonic()
+        expired: List[int] = [lease for lease, expires_at in self._leases.items() if expires_at <= now]
+
+        for lease in expired:
+            del self._leases[lease]
+            self._promoted.discard(lease)
+
+        if expired:
+            self._wake()
+
+    def _wake(self) -> None:
+        """여유 슬롯이 있다면 대기열의 플로우를 순서대로 진입시킵니다."""
+        while self._waiters and len(self._leases) < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+
+            waiter.set_result(self._grant())
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        """대기를 포기한 플로우를 정리합니다. 이미 슬롯을 넘겨받았다면 반환합니다."""
+        if waiter.done() and not waiter.cancelled():
+            self.release(waiter.result())
+            return
+
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+
+        except ValueError:
+            pass
@@ -0,0 +1,434 @@
+"""
+PASS-NICE 부하 테스트 및 프로파일링 도구
+
+로컬 가짜 NICE/요청업체 서버를 띄운 뒤, 인증 방식(sms, app_push, app_qr)별로
+N개의 가상 인증 플로우를 동시에 실행하고 단계별 응답 시간, 처리량, 커넥션 수, 메모리 사용량을 출력합니다.
+
+사용 예시:
+    python -m pass_nice bench --flows 500 --concurrency 100
+    python -m pass_nice bench --auth-type sms --profile bench.prof
+"""
+
+import argparse
+import asyncio
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from .PASS_NICE import _CLIENT_LIMITS, PASS_NICE
+from .admission import AdmissionController
+from .exceptions import AdmissionRejectedError
+
+try:
+    import resource
+
+except ImportError:  # Windows
+    resource = None  # type: ignore
+
+AUTH_TYPES = ("sms", "app_push", "app_qr")
+
+# 단계별 응답 시간 히스토그램 구간 (ms)
+_HISTOGRAM_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# 가짜 캡챠/QR 이미지 (PNG 시그니처 + 더미 데이터)
+_FAKE_IMAGE = b"\x89PNG\r\n\x1a\n" + bytes(2048)
+
+# cProfile 출력 시 라이브러리 코드만 표시하기 위한 파일명 필터
+_PROFILE_FILTER = r"PASS_NICE\.py|admission\.py"
+
+
+def _positive_int(value: str) -> int:
+    """1 이상의 정수만 허용하는 argparse 타입입니다."""
+    try:
+        number = int(value)
+
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value!r}")
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {number}")
+
+    return number
+
+
+class _StandInServer:
+    """
+    NICE 및 요청업체(ex.co.kr)의 응답 형식을 흉내내는 로컬 HTTP/1.1 서버입니다.
+
+    측정 대상인 클라이언트의 이벤트 루프와 cProfile 결과에 섞이지 않도록, 별도 스레드의 이벤트 루프에서 실행됩니다.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self._latency = latency
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="pass-nice-bench-server", daemon=True)
+
+        self.port = 0
+        self.open_connections, self.peak_connections, self.total_requests = 0, 0, 0
+
+    def start(self) -> None:
+        self._thread.start()
+        self._server = self._call(
+            asyncio.start_server(self._handle_connection, "127.0.0.1", 0, backlog=4096)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def reset_stats(self) -> None:
+        """라운드/인증 방식별 집계를 위해 최대 커넥션 수와 요청 수를 초기화합니다."""
+        self._call(self._reset_stats())
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._call(self._server.wait_closed())
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def _call(self, coro):
+        """서버 스레드의 이벤트 루프에서 코루틴을 실행하고 결과를 기다립니다."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _reset_stats(self) -> None:
+        self.peak_connections, self.total_requests = self.open_connections, 0
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.open_connections += 1
+        self.peak_connections = max(self.peak_connections, self.open_connections)
+
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, path = request_line.split(" ")[:2]
+
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        key, value = line.split(":", 1)
+                        headers[key.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length:
+                    await reader.readexactly(length)
+
+                if self._latency:
+                    await asyncio.sleep(self._latency)
+
+                self.total_requests += 1
+                content_type, body = self._route(method, path.split("?")[0])
+
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    + f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1")
+                    + body
+                )
+                await writer.drain()
+
+        finally:
+            self.open_connections -= 1
+            writer.close()
+
+    @staticmethod
+    def _route(method: str, path: str) -> Tuple[str, bytes]:
+        """요청 경로에 맞는 가짜 응답을 반환합니다."""
+        html, json_type = "text/html; charset=utf-8", "application/json"
+
+        if path.endswith("checkplus_main_company.jsp"):
+            body = (
+                '<input type="hidden" name="m" value="checkplusService">'
+                f'<input type="hidden" name="EncodeData" value="{uuid.uuid4().hex}">'
+            )
+
+        elif path.endswith("checkplus.cb"):
+            body = f'const SERVICE_INFO = "{uuid.uuid4().hex}";'
+
+        elif path.endswith("/mobileCert/method"):
+            body = f'<input type="hidden" name="certInfoHash" value="{uuid.uuid4().hex}">'
+
+        elif path.endswith("/qr/certification"):
+            body = '<div class="qr_num">123456</div>'
+
+        elif path.endswith("/certification"):
+            body = f'const captchaVersion = "{uuid.uuid4().hex}";'
+
+        elif path.startswith("/cert/captcha/image/") or path.startswith("/cert/qr/image/"):
+            return "image/png", _FAKE_IMAGE
+
+        elif path.endswith("/certification/proc") or path.endswith("/sms/confirm/proc"):
+            return json_type, json.dumps({"code": "SUCCESS"}).encode()
+
+        elif path.endswith("/polling/confirm/check/proc"):
+            return json_type, json.dumps({"code": "0000"}).encode()
+
+        elif path.endswith("/confirm/proc"):
+            return json_type, b"{}"
+
+        elif path.endswith("/cert/result/send"):
+            body = f'const queryString = "EncodeData={uuid.uuid4().hex}";'
+
+        elif path.endswith("checkplus_success_company.jsp"):
+            body = (
+                "form1.NICE_NAME.value = '홍길동';"
+                "form1.NICE_GENDER.value = '1';"
+                "form1.NICE_BIRTHEDATE.value = '20000101';"
+                "form1.NICE_MOBILENO.value = '01012345678';"
+            )
+
+        else:
+            body = ""
+
+        return html, body.encode("utf-8")
+
+
+class _LocalTransport(httpx.AsyncBaseTransport):
+    """모든 요청을 로컬 가짜 서버로 보내는 httpx 트랜스포트입니다."""
+
+    def __init__(self, port: int):
+        self._port = port
+        # PASS_NICE와 같은 커넥션 설정을 사용하되, 로컬 서버는 평문 HTTP이므로 인증서를 불러오지 않습니다.
+        self._transport = httpx.AsyncHTTPTransport(limits=_CLIENT_LIMITS, verify=False)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=self._port)
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _Stats:
+    """단계별 응답 시간과 플로우 결과를 집계합니다."""
+
+    def __init__(self):
+        self.steps: Dict[str, List[float]] = defaultdict(list)
+        self.completed, self.failed, self.rejected = 0, 0, 0
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def step(self, name: str, coro):
+        started = time.perf_counter()
+        try:
+            return await coro
+
+        finally:
+            self.steps[name].append(time.perf_counter() - started)
+
+
+async def _run_flow(
+    auth_type: str, port: int, stats: _Stats,
+    admission: Optional[AdmissionController]
+) -> None:
+    client = PASS_NICE("SK", admission=admission, transport=_LocalTransport(port))
+
+    try:
+        await stats.step("init_session", client.init_session(auth_type))  # type: ignore
+
+        if auth_type == "sms":
+            await stats.step("retrieve_captcha", client.retrieve_captcha())
+            await stats.step(
+                "send_sms_verification",
+                client.send_sms_verification("홍길동", "000101", "3", "01012345678", "123456")
+            )
+            result = await stats.step("check_sms_verification", client.check_sms_verification("123456"))
+
+        elif auth_type == "app_push":
+            await stats.step("retrieve_captcha", client.retrieve_captcha())
+            await stats.step("send_push_verification", client.send_push_verification("홍길동", "01012345678", "123456"))
+            result = await stats.step("check_push_verification", client.check_push_verification())
+
+        else:
+            await stats.step("create_qr_verification", client.create_qr_verification())
+            result = await stats.step("check_qr_verification", client.check_qr_verification())
+
+        if result.success:
+            stats.completed += 1
+
+        else:
+            stats.failed += 1
+            stats.errors[result.message] += 1
+
+    except AdmissionRejectedError:
+        stats.rejected += 1
+
+    except Exception as e:
+        stats.failed += 1
+        stats.errors[f"{type(e).__name__}: {e}"] += 1
+
+    finally:
+        await client.close()
+
+
+async def _run_auth_type(
+    auth_type: str, flows: int, concurrency: int, server: _StandInServer,
+    admission: Optional[AdmissionController]
+) -> Tuple[_Stats, float]:
+    stats = _Stats()
+    semaphore = asyncio.Semaphore(concurrency)
+    server.reset_stats()
+
+    async def bounded_flow():
+        async with semaphore:
+            await _run_flow(auth_type, server.port, stats, admission)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(bounded_flow() for _ in range(flows)))
+
+    return stats, time.perf_counter() - started
+
+
+async def _run_bench(args: argparse.Namespace, server: _StandInServer) -> None:
+    auth_types = AUTH_TYPES if args.auth_type == "all" else (args.auth_type,)
+
+    for round_no in range(1, args.rounds + 1):
+        for auth_type in auth_types:
+            admission = None
+            if args.max_sessions:
+                admission = AdmissionController(
+                    max_sessions=args.max_sessions, queue_timeout=args.queue_timeout
+                )
+
+            stats, elapsed = await _run_auth_type(auth_type, args.flows, args.concurrency, server, admission)
+            _print_report(auth_type, round_no, stats, elapsed, server)
+
+
+# ----- report ----- #
+def _percentile(sorted_values: List[float], ratio: float) -> float:
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * ratio))
+    return sorted_values[index]
+
+
+def _histogram(values: List[float]) -> str:
+    counts = [0] * (len(_HISTOGRAM_BUCKETS) + 1)
+    for value in values:
+        ms = value * 1000
+        for index, bound in enumerate(_HISTOGRAM_BUCKETS):
+            if ms <= bound:
+                counts[index] += 1
+                break
+
+        else:
+            counts[-1] += 1
+
+    labels = [f"<={bound}ms" for bound in _HISTOGRAM_BUCKETS] + [f">{_HISTOGRAM_BUCKETS[-1]}ms"]
+    peak = max(counts) or 1
+
+    return "\n".join(
+        f"      {label:>9} {count:>7} {'#' * round(count / peak * 40)}"
+        for label, count in zip(labels, counts) if count
+    )
+
+
+def _rss_mb() -> Tuple[Optional[float], Optional[float]]:
+    """현재 RSS와 최대 RSS를 MB 단위로 반환합니다. (확인할 수 없는 경우 None)"""
+    current = None
+    try:
+        with open("/proc/self/statm") as f:
+            current = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    peak = None
+    if resource is not None:
+        # ru_maxrss 단위: macOS는 바이트, Linux는 KB
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        if sys.platform == "darwin":
+            peak /= 1024
+
+    return current, peak
+
+
+def _print_report(auth_type: str, round_no: int, stats: _Stats, elapsed: float, server: _StandInServer) -> None:
+    total = stats.completed + stats.failed + stats.rejected
+    current_rss, peak_rss = _rss_mb()
+
+    print(f"\n=== [{auth_type}] round {round_no} ===")
+    print(
+        f"  flows: {total} (completed {stats.completed}, failed {stats.failed}, rejected {stats.rejected})"
+        f" in {elapsed:.3f}s -> {stats.completed / elapsed if elapsed else 0:.1f} flows/s"
+    )
+    print(
+        f"  connections: open {server.open_connections}, peak {server.peak_connections}"
+        f" | server requests: {server.total_requests}"
+    )
+    print(
+        f"  rss: current {f'{current_rss:.1f}MB' if current_rss is not None else '-'},"
+        f" peak {f'{peak_rss:.1f}MB' if peak_rss is not None else '-'}"
+    )
+
+    for name, values in stats.steps.items():
+        ordered = sorted(values)
+        print(
+            f"  {name}: n={len(ordered)}"
+            f" p50={_percentile(ordered, 0.50) * 1000:.2f}ms"
+            f" p95={_percentile(ordered, 0.95) * 1000:.2f}ms"
+            f" p99={_percentile(ordered, 0.99) * 1000:.2f}ms"
+            f" max={ordered[-1] * 1000:.2f}ms"
+        )
+        print(_histogram(ordered))
+
+    for message, count in stats.errors.items():
+        print(f"  error x{count}: {message}")
+
+
+# ----- entry point ----- #
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """`bench` 서브커맨드의 인자를 등록합니다."""
+    parser.add_argument("--auth-type", choices=AUTH_TYPES + ("all",), default="all", help="실행할 인증 방식 (기본값: all)")
+    parser.add_argument("--flows", type=_positive_int, default=200, help="인증 방식별 전체 플로우 수 (기본값: 200)")
+    parser.add_argument("--concurrency", type=_positive_int, default=50, help="동시에 실행할 플로우 수 (기본값: 50)")
+    parser.add_argument("--rounds", type=_positive_int, default=1, help="반복 횟수 (py-spy 등 외부 프로파일러 부착 시 늘려서 사용)")
+    parser.add_argument("--server-latency", type=float, default=0.0, help="가짜 서버의 요청당 지연 시간 (ms)")
+    parser.add_argument("--max-sessions", type=int, default=0, help="지정 시 AdmissionController를 적용할 최대 세션 수")
+    parser.add_argument("--queue-timeout", type=float, default=5.0, help="AdmissionController 대기 시간 (초)")
+    parser.add_argument("--profile", metavar="PATH", help="cProfile 결과를 저장할 경로 (snakeviz 등으로 확인 가능)")
+    parser.add_argument("--profile-top", type=int, default=25, help="출력할 cProfile 상위 함수 수 (기본값: 25)")
+
+
+def run(args: argparse.Namespace) -> int:
+    """`bench` 서브커맨드를 실행합니다."""
+    # py-spy 등 외부 프로파일러를 부착할 수 있도록 PID를 출력 (Ex: py-spy record --pid <PID>)
+    print(f"pass_nice bench (pid {os.getpid()})")
+
+    server = _StandInServer(latency=args.server_latency / 1000)
+    server.start()
+
+    # cProfile은 활성화한 스레드만 측정하므로, 서버 스레드는 결과에 포함되지 않습니다.
+    profiler = cProfile.Profile() if args.profile else None
+
+    try:
+        if profiler is not None:
+            profiler.enable()
+
+        try:
+            asyncio.run(_run_bench(args, server))
+
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(args.profile)
+
+    finally:
+        server.close()
+
+    if profiler is not None:
+        print(f"\n=== cProfile (pass_nice, cumulative) -> {args.profile} ===")
+        pstats.Stats(args.profile).sort_stats("cumulative").print_stats(_PROFILE_FILTER, args.profile_top)
+
+    return 0
@@ -33,3 +33,8 @@ class ValidationError(PassNiceError):
     """입력 데이터 검증 오류 시 발생하는 예외"""
     def __init__(self, message: str, error_code: int = 3):
         super().__init__(message, error_code)
+
+class AdmissionRejectedError(PassNiceError):
+    """서버 부하로 인해 새로운 인증 세션 시작이 거절되었을 때 발생하는 예외"""
+    def __init__(self, message: str = "현재 요청이 많아 새로운 인증 세션을 시작할 수 없습니다.", error_code: int = 4):
+        super().__init__(message, error_code)
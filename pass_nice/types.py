@@ -4,10 +4,15 @@ PASS-NICE 타입 정의
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Generic, Literal, Optional, TypeVar
+from typing import Any, AsyncIterator, Generic, Literal, Optional, TypeVar, Union
 
 T = TypeVar("T")
 
+# 캡챠/QR 이미지 반환 형식
+# (bytes: 원본, memoryview: 복사 없는 뷰, base64: 문자열, data_uri: data:image/...;base64,..., stream: 바이트 청크 비동기 이터레이터)
+ImageFormat = Literal["bytes", "memoryview", "base64", "data_uri", "stream"]
+ImageData = Union[bytes, memoryview, str, AsyncIterator[bytes]]
+
 @dataclass(frozen=True)
 class Result(Generic[T]):
     """API 호출 결과를 나타내는 제네릭 데이터 클래스"""
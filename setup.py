@@ -9,6 +9,7 @@ setup(
     url='https://github.com/shy9-29/PASS-NICE',
     install_requires=['httpx>=0.25.0'],
     packages=find_packages(exclude=[]),
+    entry_points={'console_scripts': ['pass-nice=pass_nice.__main__:main']},
     keywords=['nice', 'verification', 'sms', 'identity', 'korea', 'authentication'],
     python_requires='>=3.8',
     package_data={},
@@ -0,0 +1,286 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from pass_nice import AdmissionController, PASS_NICE
+from pass_nice.exceptions import AdmissionRejectedError, NetworkError, ValidationError
+from pass_nice.types import VerificationData
+
+
+def test_abandoned_leases_expire():
+    async def run():
+        admission = AdmissionController(max_sessions=2, queue_timeout=0.01, lease_timeout=0.05)
+
+        # 두 세션이 release/close 없이 방치됨
+        await admission.acquire()
+        await admission.acquire()
+
+        with pytest.raises(AdmissionRejectedError):
+            await admission.acquire()
+
+        await asyncio.sleep(0.06)
+
+        lease = await admission.acquire()
+        assert admission.in_flight == 1
+
+        admission.release(lease)
+        assert admission.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_queued_flow_takes_expired_lease():
+    async def run():
+        admission = AdmissionController(max_sessions=1, queue_timeout=1.0, lease_timeout=0.05)
+        abandoned = await admission.acquire()
+
+        started = time.monotonic()
+        lease = await admission.acquire()
+
+        assert lease != abandoned
+        assert time.monotonic() - started < 0.5
+
+        # 만료된 리스의 뒤늦은 반환은 무시됨
+        admission.release(abandoned)
+        assert admission.in_flight == 1
+
+    asyncio.run(run())
+
+
+def test_renew_keeps_active_lease():
+    async def run():
+        admission = AdmissionController(max_sessions=1, lease_timeout=0.05)
+        lease = await admission.acquire()
+
+        for _ in range(3):
+            await asyncio.sleep(0.03)
+            admission.renew(lease)
+
+        assert admission.in_flight == 1
+
+    asyncio.run(run())
+
+
+def test_new_flows_shed_when_promoted_sessions_fill_limit():
+    async def run():
+        admission = AdmissionController(max_sessions=2, queue_timeout=5.0)
+        for _ in range(2):
+            admission.promote(await admission.acquire())
+
+        started = time.monotonic()
+        with pytest.raises(AdmissionRejectedError):
+            await admission.acquire()
+
+        assert time.monotonic() - started < 0.5
+        assert admission.queued == 0
+
+    asyncio.run(run())
+
+
+def test_backoff_interval_limits_consecutive_backoff():
+    admission = AdmissionController(max_sessions=16, latency_target=1.0, backoff_interval=60.0)
+
+    admission.observe(5.0)
+    admission.observe(5.0)
+
+    assert admission.limit == 8
+
+
+def test_local_paths_are_not_observed():
+    async def run():
+        admission = AdmissionController(max_sessions=100, initial_sessions=20)
+        client = PASS_NICE("SK", admission=admission)
+
+        client._is_initialized, client._is_verify_sent = True, True
+        client._AUTH_TYPE, client._CAPTCHA_VERSION = "app_push", ""
+        client._verification_result = VerificationData(
+            name="홍길동", birthdate=None, gender="1",  # type: ignore
+            phone_number="01012345678", mobile_carrier="SK"
+        )
+
+        for _ in range(50):
+            await client.check_push_verification()
+
+        with pytest.raises(ValidationError):
+            await client.send_push_verification("홍길동", "010", "123456")
+
+        await client.close()
+        assert admission.limit == 20
+
+    asyncio.run(run())
+
+
+def test_invalid_arguments_are_rejected():
+    for kwargs in ({"initial_sessions": 0}, {"max_queue": -1}, {"queue_timeout": -1.0}):
+        with pytest.raises(ValidationError):
+            AdmissionController(max_sessions=10, **kwargs)
+
+
+def test_fast_samples_raise_limit():
+    admission = AdmissionController(max_sessions=10, initial_sessions=2, latency_target=1.0)
+
+    for _ in range(6):
+        admission.observe(0.01)
+
+    assert admission.limit > 2
+
+
+def test_queued_waiters_are_granted_in_fifo_order():
+    async def run():
+        admission = AdmissionController(max_sessions=1, queue_timeout=1.0)
+        lease = await admission.acquire()
+        granted = []
+
+        async def wait(name):
+            granted.append((name, await admission.acquire()))
+
+        first = asyncio.ensure_future(wait("first"))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(wait("second"))
+        await asyncio.sleep(0)
+
+        admission.release(lease)
+        await first
+        assert [name for name, _ in granted] == ["first"]
+
+        admission.release(granted[0][1])
+        await second
+        assert [name for name, _ in granted] == ["first", "second"]
+
+    asyncio.run(run())
+
+
+# ----- PASS_NICE 연동 ----- #
+def _nice_handler(fail_on=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if fail_on and path.endswith(fail_on):
+            raise httpx.ConnectError("connection failed", request=request)
+
+        if path.endswith("checkplus_main_company.jsp"):
+            return httpx.Response(200, text=(
+                '<input type="hidden" name="m" value="checkplusService">'
+                '<input type="hidden" name="EncodeData" value="encoded">'
+            ))
+
+        if path.endswith("checkplus.cb"):
+            return httpx.Response(200, text='const SERVICE_INFO = "svc";')
+
+        if path.endswith("/mobileCert/method"):
+            return httpx.Response(200, text='<input type="hidden" name="certInfoHash" value="hash">')
+
+        if path.endswith("/qr/certification"):
+            return httpx.Response(200, text='<div class="qr_num">123456</div>')
+
+        if path.endswith("/certification"):
+            return httpx.Response(200, text='const captchaVersion = "captcha";')
+
+        if "/image/" in path:
+            return httpx.Response(200, content=b"\x89PNG", headers={"content-type": "image/png"})
+
+        if path.endswith("/certification/proc") or path.endswith("/sms/confirm/proc"):
+            return httpx.Response(200, json={"code": "SUCCESS"})
+
+        if path.endswith("/polling/confirm/check/proc"):
+            return httpx.Response(200, json={"code": "0000"})
+
+        if path.endswith("/cert/result/send"):
+            return httpx.Response(200, text='const queryString = "EncodeData=abc";')
+
+        if path.endswith("checkplus_success_company.jsp"):
+            return httpx.Response(200, text=(
+                "form1.NICE_NAME.value = '홍길동';"
+                "form1.NICE_GENDER.value = '1';"
+                "form1.NICE_BIRTHEDATE.value = '20000101';"
+                "form1.NICE_MOBILENO.value = '01012345678';"
+            ))
+
+        return httpx.Response(200, json={})
+
+    return handler
+
+
+def _client(admission, fail_on=None) -> PASS_NICE:
+    return PASS_NICE("SK", admission=admission, transport=httpx.MockTransport(_nice_handler(fail_on)))
+
+
+def test_init_session_rejected_when_full():
+    async def run():
+        admission = AdmissionController(max_sessions=1, max_queue=0)
+
+        async with _client(admission) as first, _client(admission) as second:
+            await first.init_session("sms")
+
+            with pytest.raises(AdmissionRejectedError):
+                await second.init_session("sms")
+
+            assert not second._is_initialized
+
+        assert admission.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_slot_released_when_session_start_fails():
+    async def run():
+        admission = AdmissionController(max_sessions=1)
+
+        async with _client(admission, fail_on="checkplus.cb") as client:
+            with pytest.raises(NetworkError):
+                await client.init_session("sms")
+
+            assert admission.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_sms_flow_promotes_and_releases():
+    async def run():
+        admission = AdmissionController(max_sessions=2)
+
+        async with _client(admission) as client:
+            await client.init_session("sms")
+            assert (admission.in_flight, admission.in_progress) == (1, 0)
+
+            await client.send_sms_verification("홍길동", "000101", "3", "01012345678", "123456")
+            assert (admission.in_flight, admission.in_progress) == (1, 1)
+
+            result = await client.check_sms_verification("123456")
+            assert result.success
+            assert (admission.in_flight, admission.in_progress) == (0, 0)
+
+    asyncio.run(run())
+
+
+def test_push_flow_promotes_and_releases():
+    async def run():
+        admission = AdmissionController(max_sessions=2)
+
+        async with _client(admission) as client:
+            await client.init_session("app_push")
+            await client.send_push_verification("홍길동", "01012345678", "123456")
+            assert admission.in_progress == 1
+
+            result = await client.check_push_verification()
+            assert result.success
+            assert (admission.in_flight, admission.in_progress) == (0, 0)
+
+    asyncio.run(run())
+
+
+def test_qr_flow_promotes_and_releases():
+    async def run():
+        admission = AdmissionController(max_sessions=2)
+
+        async with _client(admission) as client:
+            await client.init_session("app_qr")
+            await client.create_qr_verification()
+            assert admission.in_progress == 1
+
+            result = await client.check_qr_verification()
+            assert result.success
+            assert (admission.in_flight, admission.in_progress) == (0, 0)
+
+    asyncio.run(run())
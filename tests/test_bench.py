@@ -0,0 +1,19 @@
+import pytest
+
+from pass_nice.__main__ import main
+
+
+def test_bench_reports_per_run_counters(capsys):
+    assert main(["bench", "--auth-type", "app_qr", "--flows", "2", "--concurrency", "2", "--rounds", "2"]) == 0
+
+    output = capsys.readouterr().out
+    assert output.count("flows: 2 (completed 2, failed 0, rejected 0)") == 2
+    assert output.count("server requests: 22") == 2
+
+
+def test_bench_rejects_non_positive_counts(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        main(["bench", "--flows", "0"])
+
+    assert exc_info.value.code == 2
+    assert "--flows" in capsys.readouterr().err
@@ -0,0 +1,251 @@
+import asyncio
+import uuid
+
+import httpx
+import pytest
+
+from pass_nice import PASS_NICE
+from pass_nice.exceptions import NetworkError, SessionNotInitializedError
+
+SUCCESS_PAGE = (
+    "form1.NICE_NAME.value = '홍길동';"
+    "form1.NICE_GENDER.value = '1';"
+    "form1.NICE_BIRTHEDATE.value = '20000101';"
+    "form1.NICE_MOBILENO.value = '01012345678';"
+)
+
+
+def _nice_handler(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        path = request.url.path
+
+        if path.endswith("/polling/confirm/check/proc"):
+            return httpx.Response(200, json={"code": "0000"})
+
+        if path.endswith("/cert/result/send"):
+            return httpx.Response(200, text='const queryString = "EncodeData=abc";')
+
+        if path.endswith("checkplus_success_company.jsp"):
+            return httpx.Response(200, text=SUCCESS_PAGE)
+
+        return httpx.Response(200, json={})
+
+    return handler
+
+
+def _push_client(calls, auth_type="app_push") -> PASS_NICE:
+    client = PASS_NICE("SK", transport=httpx.MockTransport(_nice_handler(calls)))
+
+    client._is_initialized, client._is_verify_sent = True, True
+    client._AUTH_TYPE, client._CAPTCHA_VERSION, client._SERVICE_INFO = auth_type, "", "svc"
+
+    return client
+
+
+def test_parse_form_values_keeps_first_match():
+    form_values = PASS_NICE._parse_form_values(
+        "form1.NICE_GENDER.value = '1'; form1.NICE_GENDER.value = '2';"
+    )
+
+    assert form_values == {"NICE_GENDER": "1"}
+
+
+def test_check_push_verification_returns_cached_result():
+    async def run():
+        calls = []
+        async with _push_client(calls) as client:
+            first = await client.check_push_verification()
+            request_count = len(calls)
+
+            second = await client.check_push_verification()
+            third = await client.check_push_verification()
+
+        assert first.success and second.success and third.success
+        assert first.data.name == "홍길동"
+        assert second.data is first.data and third.data is first.data
+        assert len(calls) == request_count
+
+    asyncio.run(run())
+
+
+def test_check_qr_verification_returns_cached_result():
+    async def run():
+        calls = []
+        async with _push_client(calls, "app_qr") as client:
+            first = await client.check_qr_verification()
+            request_count = len(calls)
+
+            second = await client.check_qr_verification()
+
+        assert first.success and second.success
+        assert second.data is first.data
+        assert len(calls) == request_count
+
+    asyncio.run(run())
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    def __init__(self, opened):
+        self._opened = opened
+        self._opened.append(self)
+
+    async def __aiter__(self):
+        yield b"\x89PNG"
+        yield b"image"
+
+    async def aclose(self):
+        self._opened.remove(self)
+
+
+def _image_client(calls, statuses=None, opened=None) -> PASS_NICE:
+    statuses = statuses if statuses is not None else []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith("/qr/certification"):
+            return httpx.Response(200, text='<div class="qr_num">123456</div>')
+
+        if request.url.path.endswith("/certification/proc"):
+            return httpx.Response(200, json={"code": "FAIL", "message": "보안문자가 일치하지 않습니다."})
+
+        status = statuses.pop(0) if statuses else 200
+        if status != 200:
+            return httpx.Response(status, text="<html>error</html>", headers={"content-type": "text/html"})
+
+        if opened is not None:
+            return httpx.Response(200, stream=_TrackedStream(opened), headers={"content-type": "image/png"})
+
+        return httpx.Response(200, content=b"\x89PNGimage", headers={"content-type": "image/png"})
+
+    client = PASS_NICE("SK", transport=httpx.MockTransport(handler))
+
+    client._is_initialized = True
+    client._AUTH_TYPE, client._CAPTCHA_VERSION = "sms", "captcha"
+    client._SERVICE_INFO, client._CERT_INFO_HASH = uuid.uuid4().hex, "hash"
+
+    return client
+
+
+def test_error_response_is_not_cached():
+    async def run():
+        calls = []
+        async with _image_client(calls, statuses=[503]) as client:
+            with pytest.raises(NetworkError):
+                await client.retrieve_captcha(image_format="data_uri")
+
+            result = await client.retrieve_captcha(image_format="data_uri")
+
+        assert result.data == "data:image/png;base64,iVBOR2ltYWdl"
+        assert len(calls) == 2
+
+    asyncio.run(run())
+
+
+def test_writer_and_stream_populate_cache():
+    async def run():
+        calls, written = [], []
+        async with _image_client(calls) as client:
+            await client.retrieve_captcha(writer=written.append)
+            cached = await client.retrieve_captcha()
+
+            client._CAPTCHA_VERSION = "captcha2"
+            stream = (await client.retrieve_captcha(image_format="stream")).data
+            streamed = b"".join([chunk async for chunk in stream])
+            cached_stream = (await client.retrieve_captcha(image_format="stream")).data
+
+            assert [chunk async for chunk in cached_stream] == [streamed]
+
+        assert b"".join(written) == cached.data == streamed == b"\x89PNGimage"
+        assert len(calls) == 2
+
+    asyncio.run(run())
+
+
+def test_unconsumed_stream_releases_response():
+    async def run():
+        opened = []
+        async with _image_client([], opened=opened) as client:
+            stream = (await client.retrieve_captcha(image_format="stream")).data
+            del stream
+            assert opened == []
+
+            with pytest.raises(RuntimeError):
+                await client.retrieve_captcha(refresh=True, writer=_failing_writer)
+
+            assert opened == []
+
+    asyncio.run(run())
+
+
+def _failing_writer(chunk):
+    raise RuntimeError("disk full")
+
+
+def test_refresh_and_failed_send_fetch_new_captcha():
+    async def run():
+        calls = []
+        async with _image_client(calls) as client:
+            await client.retrieve_captcha()
+            await client.retrieve_captcha(refresh=True)
+            assert len(calls) == 2
+
+            result = await client.send_sms_verification("홍길동", "000101", "3", "01012345678", "000000")
+            assert not result.success
+
+            await client.retrieve_captcha()
+            assert len(calls) == 4
+
+    asyncio.run(run())
+
+
+def test_close_clears_image_cache():
+    async def run():
+        client = _image_client([])
+        await client.retrieve_captcha()
+        assert client._image_cache
+
+        await client.close()
+        assert not client._image_cache
+
+        assert not _image_client([])._image_cache
+
+    asyncio.run(run())
+
+
+def test_encoded_image_is_cached():
+    async def run():
+        async with _image_client([]) as client:
+            first = await client.retrieve_captcha(image_format="base64")
+            second = await client.retrieve_captcha(image_format="base64")
+
+        assert first.data is second.data
+
+    asyncio.run(run())
+
+
+def test_retrieve_qr_image_reuses_qr_number():
+    async def run():
+        calls = []
+        async with _image_client(calls) as client:
+            with pytest.raises(SessionNotInitializedError):
+                await client.retrieve_qr_image()
+
+            created = await client.create_qr_verification()
+            request_count = len(calls)
+
+            retrieved = await client.retrieve_qr_image(image_format="memoryview")
+
+        assert retrieved.message == created.message == "123456"
+        assert bytes(retrieved.data) == created.data
+        assert len(calls) == request_count
+
+    asyncio.run(run())
+
+
+def test_client_keeps_default_pool_limits():
+    from pass_nice.PASS_NICE import _CLIENT_LIMITS
+
+    assert _CLIENT_LIMITS.max_connections == 100
+    assert _CLIENT_LIMITS.max_keepalive_connections == 20
+    assert _CLIENT_LIMITS.keepalive_expiry == 120.0